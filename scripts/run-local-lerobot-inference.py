@@ -27,13 +27,16 @@ Usage:
 """
 
 import argparse
+import contextlib
 import json
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
+import pyarrow as pa
 import pyarrow.parquet as pq
 import torch
 
@@ -72,16 +75,69 @@ def find_video_file(dataset_dir: str, video_key: str, ep_idx: int, info: dict) -
     return None
 
 
-def load_video_frames(video_path: str) -> list[np.ndarray]:
+def load_episode_table(data_file: str, ep_idx: int) -> pa.Table:
+    """Read one episode's evaluation columns from a parquet data file.
+
+    Only the needed columns are decoded, and the episode_index predicate is
+    pushed into the reader so row groups whose statistics exclude the episode
+    are skipped.
+    """
+    names = pq.read_schema(data_file).names
+    columns = [c for c in ("episode_index", "frame_index", "timestamp", "observation.state", "action") if c in names]
+    filters = [("episode_index", "==", ep_idx)] if "episode_index" in names else None
+    table = pq.read_table(data_file, columns=columns, filters=filters)
+    if "frame_index" in names:
+        table = table.sort_by("frame_index")
+    return table
+
+
+def column_to_float32(table: pa.Table, name: str) -> np.ndarray:
+    """Convert a scalar or list column to a float32 array without Python lists.
+
+    List columns (e.g. observation.state) are flattened into their contiguous
+    child values and reshaped to (N, dim); an empty column yields shape (0, 0).
+    Lists of lists have no flat child buffer and fall back to ``to_pylist``.
+    """
+    column = table[name].combine_chunks()
+    if pa.types.is_list(column.type) or pa.types.is_large_list(column.type) or pa.types.is_fixed_size_list(column.type):
+        values = column.flatten()
+        if pa.types.is_nested(values.type):
+            return np.array(column.to_pylist(), dtype=np.float32)
+        flat = np.array(values.to_numpy(zero_copy_only=False), dtype=np.float32)
+        return flat.reshape(len(column), len(flat) // max(len(column), 1))
+    return np.array(column.to_numpy(zero_copy_only=False), dtype=np.float32)
+
+
+def load_video_frames(video_path: str, hwaccel: str | None = None) -> list[np.ndarray]:
     import av
 
-    container = av.open(video_path)
+    container = None
+    if hwaccel:
+        from av.codec.hwaccel import HWAccel
+
+        # Decode on NVDEC/VideoToolbox/etc.; frames are downloaded to host memory for rgb24 conversion
+        try:
+            container = av.open(video_path, hwaccel=HWAccel(device_type=hwaccel, allow_software_fallback=True))
+        except (av.error.FFmpegError, OSError) as e:
+            print(f"  [WARN] {hwaccel} decode unavailable ({e}); using software decode")
+    if container is None:
+        container = av.open(video_path)
     stream = container.streams.video[0]
     frames = [f.to_ndarray(format="rgb24") for f in container.decode(stream)]
     container.close()
     return frames
 
 
+def load_episode_inputs(
+    data_file: str, video_file: str, ep_idx: int, hwaccel: str | None = None
+) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
+    """Load one episode's states, actions, and decoded video frames."""
+    table = load_episode_table(data_file, ep_idx)
+    states = column_to_float32(table, "observation.state")
+    actions = column_to_float32(table, "action")
+    return states, actions, load_video_frames(video_file, hwaccel=hwaccel)
+
+
 def download_aml_model(model_name: str, model_version: str) -> Path:
     from azure.ai.ml import MLClient
     from azure.identity import DefaultAzureCredential
@@ -113,12 +169,13 @@ def download_aml_model(model_name: str, model_version: str) -> Path:
     return model_path
 
 
-def _load_normalizer_stats(policy: torch.nn.Module, model_dir: Path) -> None:
+def _load_normalizer_stats(policy: torch.nn.Module, model_dir: Path, device: str = "cpu") -> None:
     """Load normalization stats from preprocessor/postprocessor safetensors into policy buffers.
 
     Older LeRobot checkpoints store stats in separate processor files rather than
     in the model weights. This bridges the gap by reading those files and populating
-    the policy's normalize_inputs/unnormalize_outputs buffers.
+    the policy's normalize_inputs/unnormalize_outputs buffers. Tensors are loaded
+    directly onto ``device``, which should match the policy's device.
     """
     import glob
 
@@ -128,7 +185,7 @@ def _load_normalizer_stats(policy: torch.nn.Module, model_dir: Path) -> None:
     stats: dict[str, torch.Tensor] = {}
     for sf in sorted(glob.glob(str(model_dir / "*.safetensors"))):
         if "processor" in Path(sf).name:
-            stats.update(st.load_file(sf))
+            stats.update(st.load_file(sf, device=device))
 
     if not stats:
         return
@@ -199,13 +256,25 @@ def run_evaluation(args: argparse.Namespace) -> None:
 
     t0 = time.time()
     policy = ACTPolicy.from_pretrained(policy_path)
-
-    # Load normalization stats from preprocessor files if normalizer buffers are missing
-    _load_normalizer_stats(policy, Path(policy_path))
-
     policy.to(device)
+
+    # Load normalization stats from preprocessor files if normalizer buffers are missing;
+    # done after the move so stats go straight to the device instead of via host buffers
+    _load_normalizer_stats(policy, Path(policy_path), device)
     print(f"  Loaded in {time.time() - t0:.1f}s ({sum(p.numel() for p in policy.parameters()) / 1e6:.1f}M params)")
 
+    # Reduced-precision matmuls/convs via autocast; weights and normalization stay float32
+    autocast_dtype = {"bf16": torch.bfloat16, "fp16": torch.float16}.get(args.precision)
+    use_autocast = autocast_dtype is not None
+    if use_autocast:
+        print(f"  Running inference under {args.precision} autocast")
+
+    if args.compile:
+        # Static observation shapes let CUDA graphs replay the whole forward pass
+        compile_mode = "reduce-overhead" if device == "cuda" else "default"
+        policy.model = torch.compile(policy.model, mode=compile_mode)
+        print(f"  Compiled policy model (mode={compile_mode}); first steps include compilation time")
+
     # Load dataset info
     info_path = os.path.join(args.dataset_dir, "meta", "info.json")
     with open(info_path) as f:
@@ -236,65 +305,86 @@ def run_evaluation(args: argparse.Namespace) -> None:
 
     all_metrics = []
 
+    # Parquet reads and video decode release the GIL, so the next episode is loaded
+    # on a background thread while the current one runs inference
+    episode_files = [
+        (find_data_file(args.dataset_dir, ep, info), find_video_file(args.dataset_dir, image_key, ep, info))
+        for ep in range(num_episodes)
+    ]
+    loader = ThreadPoolExecutor(max_workers=1)
+
+    def submit_load(ep: int) -> Future | None:
+        data_file, video_file = episode_files[ep]
+        if not data_file or not video_file:
+            return None
+        return loader.submit(load_episode_inputs, data_file, video_file, ep, args.hwaccel)
+
+    pending = submit_load(0) if num_episodes else None
+
     for ep in range(num_episodes):
         print(f"\n{'=' * 60}")
         print(f"Episode {ep}")
         print(f"{'=' * 60}")
 
-        data_file = find_data_file(args.dataset_dir, ep, info)
+        current = pending
+        pending = submit_load(ep + 1) if ep + 1 < num_episodes else None
+
+        data_file, video_file = episode_files[ep]
         if not data_file:
             print(f"  [SKIP] No data file for episode {ep}")
             continue
-
-        table = pq.read_table(data_file)
-        data = {col: table[col].to_pylist() for col in table.column_names}
-        n_frames = len(data["timestamp"])
-
-        video_file = find_video_file(args.dataset_dir, image_key, ep, info)
         if not video_file:
             print(f"  [SKIP] No video for episode {ep} ({image_key})")
             continue
 
-        frames = load_video_frames(video_file)
+        states, actions, frames = current.result()
+        n_frames = len(states)
+        if n_frames == 0:
+            print(f"  [SKIP] No rows for episode {ep} in {data_file}")
+            continue
+
+        num_steps = min(n_frames - 1, len(frames))
+        if num_steps <= 0:
+            print(f"  [SKIP] Too few frames for episode {ep} ({n_frames} rows, {len(frames)} video frames)")
+            continue
 
         policy.reset()
-        actions_predicted = []
-        actions_ground_truth = []
-        inference_times = []
 
-        num_steps = min(n_frames - 1, len(frames))
+        # Preallocate per-step outputs; ground truth is a slice of the action array
+        gt = actions[:num_steps]
+        pred = np.empty_like(gt)
+        inf_times = np.empty(num_steps)
+
         for step in range(num_steps):
-            state = np.array(data["observation.state"][step], dtype=np.float32)
-            gt_action = np.array(data["action"][step], dtype=np.float32)
+            state = states[step]
             image = frames[step]
 
+            # Upload uint8 HWC (4x fewer bytes) and do the layout/scale conversion on device
             obs = {
-                "observation.state": torch.from_numpy(state).float().unsqueeze(0).to(device),
-                image_key: (torch.from_numpy(image).float().permute(2, 0, 1) / 255.0).unsqueeze(0).to(device),
+                "observation.state": torch.from_numpy(state).unsqueeze(0).to(device),
+                image_key: torch.from_numpy(image).to(device).permute(2, 0, 1).unsqueeze(0).float().div_(255.0),
             }
 
+            autocast = torch.autocast(device, dtype=autocast_dtype) if use_autocast else contextlib.nullcontext()
             t_start = time.time()
-            with torch.inference_mode():
+            with torch.inference_mode(), autocast:
                 action = policy.select_action(obs)
             t_inf = time.time() - t_start
-            inference_times.append(t_inf)
+            inf_times[step] = t_inf
 
-            action_np = action.squeeze(0).cpu().numpy()
-            actions_predicted.append(action_np)
-            actions_ground_truth.append(gt_action)
+            action_np = action.squeeze(0).float().cpu().numpy()
+            pred[step] = action_np
 
             if step < 3 or step == num_steps - 1:
                 print(
                     f"  step {step:3d}: pred=[{', '.join(f'{a:7.3f}' for a in action_np[:6])}]  ({t_inf * 1000:.1f}ms)"
                 )
 
-        pred = np.array(actions_predicted)
-        gt = np.array(actions_ground_truth)
-        inf_times = np.array(inference_times)
-
-        mse = float(np.mean((pred - gt) ** 2))
-        mae = float(np.mean(np.abs(pred - gt)))
-        per_dim_mae = np.mean(np.abs(pred - gt), axis=0)
+        # Reuse one (N, dim) error array for the metrics and the summary plots
+        error = np.abs(pred - gt)
+        mse = float(np.mean(np.square(error)))
+        mae = float(np.mean(error))
+        per_dim_mae = np.mean(error, axis=0)
         avg_inf_ms = float(np.mean(inf_times) * 1000)
         throughput = float(1.0 / np.mean(inf_times))
 
@@ -338,7 +428,6 @@ def run_evaluation(args: argparse.Namespace) -> None:
         plt.close(fig)
 
         # Plot: summary panel
-        error = np.abs(pred - gt)
         colors = plt.cm.tab10(np.linspace(0, 1, n_dims))
         fig, axes_panel = plt.subplots(2, 2, figsize=(14, 8))
         fig.suptitle(f"Episode {ep} — Inference Summary", fontsize=14, fontweight="bold")
@@ -387,6 +476,8 @@ def run_evaluation(args: argparse.Namespace) -> None:
         print(f"  Saved plots to {plots_dir}/ep{ep:03d}_*.png")
 
     # Aggregate
+    loader.shutdown()
+
     if not all_metrics:
         print("\nNo episodes evaluated.")
         return
@@ -444,6 +535,23 @@ def main() -> None:
         "--device", default="cpu", choices=["cuda", "cpu", "mps"], help="Inference device (default: cpu)"
     )
 
+    parser.add_argument(
+        "--precision",
+        default="fp32",
+        choices=["fp32", "bf16", "fp16"],
+        help="Inference compute precision via autocast (default: fp32)",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the ACT model with torch.compile (uses CUDA graphs on cuda)",
+    )
+    parser.add_argument(
+        "--hwaccel",
+        default=None,
+        help="PyAV hardware decode device type, e.g. cuda or videotoolbox (default: software decode)",
+    )
+
     args = parser.parse_args()
 
     if not args.policy_path and not (args.model_name and args.model_version):
@@ -23,12 +23,21 @@ import sys
 import time
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import torch
 
 
-def load_video_frame(dataset_dir: str, episode: int, frame: int) -> np.ndarray:
-    """Extract a single frame from an episode video using av."""
+def load_video_frames(dataset_dir: str, episode: int, start_frame: int, n_frames: int, fps: float) -> list[np.ndarray]:
+    """Decode ``n_frames`` consecutive frames of an episode video starting at ``start_frame``.
+
+    Seeks to the keyframe at or before ``start_frame`` and decodes forward once,
+    instead of decoding the video from its first frame for every step.
+    """
+    if n_frames <= 0:
+        return []
+
     import av
 
     video_path = os.path.join(
@@ -40,20 +49,54 @@ def load_video_frame(dataset_dir: str, episode: int, frame: int) -> np.ndarray:
     )
     container = av.open(video_path)
     stream = container.streams.video[0]
-    for i, av_frame in enumerate(container.decode(stream)):
-        if i == frame:
-            img = av_frame.to_ndarray(format="rgb24")
-            container.close()
-            return img
+    offset = stream.start_time or 0
+    if start_frame > 0:
+        container.seek(offset + int(start_frame / fps / stream.time_base), stream=stream, backward=True)
+    frames = []
+    for av_frame in container.decode(stream):
+        if round((av_frame.pts - offset) * stream.time_base * fps) < start_frame:
+            continue
+        frames.append(av_frame.to_ndarray(format="rgb24"))
+        if len(frames) == n_frames:
+            break
     container.close()
-    raise IndexError(f"Frame {frame} not found in {video_path}")
+    if len(frames) < n_frames:
+        raise IndexError(f"Frame {start_frame + len(frames)} not found in {video_path}")
+    return frames
 
 
 def load_episode_data(dataset_dir: str, episode: int) -> dict:
-    """Load parquet data for a specific episode."""
+    """Load parquet data for a specific episode.
+
+    v3 data files may hold several episodes, so rows are selected with an Arrow
+    compute kernel and ordered by frame_index before conversion. List columns
+    (e.g. observation.state) are flattened into (N, dim) numpy arrays rather
+    than Python lists.
+    """
     data_path = os.path.join(dataset_dir, "data", f"chunk-{episode:03d}", f"file-{episode:03d}.parquet")
     table = pq.read_table(data_path)
-    return {col: table[col].to_pylist() for col in table.column_names}
+    if "episode_index" in table.column_names:
+        table = table.filter(pc.equal(table["episode_index"], episode))
+    if "frame_index" in table.column_names:
+        table = table.sort_by("frame_index")
+    return {col: column_to_numpy(table, col) for col in table.column_names}
+
+
+def column_to_numpy(table: pa.Table, name: str) -> np.ndarray:
+    """Convert a scalar or list column to a numpy array without Python lists.
+
+    List columns are flattened into their contiguous child values and reshaped
+    to (N, dim); an empty column yields shape (0, 0). Lists of lists have no
+    flat child buffer and fall back to ``to_pylist``.
+    """
+    column = table[name].combine_chunks()
+    if pa.types.is_list(column.type) or pa.types.is_large_list(column.type) or pa.types.is_fixed_size_list(column.type):
+        values = column.flatten()
+        if pa.types.is_nested(values.type):
+            return np.array(column.to_pylist())
+        flat = values.to_numpy(zero_copy_only=False)
+        return flat.reshape(len(column), len(flat) // max(len(column), 1))
+    return column.to_numpy(zero_copy_only=False)
 
 
 def build_observation(state: np.ndarray, image: np.ndarray) -> dict[str, torch.Tensor]:
@@ -124,6 +167,7 @@ def run_inference_test(args: argparse.Namespace) -> None:
     start = args.start_frame
     num_steps = min(args.num_steps, n_frames - start - 1)
     print(f"\nEpisode {episode}: {n_frames} frames, starting at frame {start}, testing {num_steps} steps")
+    frames = load_video_frames(args.dataset_dir, episode, start, num_steps, fps)
 
     # Run inference loop
     policy.reset()
@@ -135,7 +179,7 @@ def run_inference_test(args: argparse.Namespace) -> None:
         frame_idx = start + step
         state = np.array(data["observation.state"][frame_idx], dtype=np.float32)
         gt_action = np.array(data["action"][frame_idx], dtype=np.float32)
-        image = load_video_frame(args.dataset_dir, episode, frame_idx)
+        image = frames[step]
 
         obs = build_observation(state, image)
         obs = preprocessor(obs)
@@ -162,9 +206,10 @@ def run_inference_test(args: argparse.Namespace) -> None:
     # Compute metrics
     pred = np.array(actions_predicted)
     gt = np.array(actions_ground_truth)
-    mse = np.mean((pred - gt) ** 2)
-    mae = np.mean(np.abs(pred - gt))
-    per_joint_mae = np.mean(np.abs(pred - gt), axis=0)
+    error = np.abs(pred - gt)
+    mse = np.mean(np.square(error))
+    mae = np.mean(error)
+    per_joint_mae = np.mean(error, axis=0)
 
     avg_inf_ms = np.mean(inference_times) * 1000
     p95_inf_ms = np.percentile(inference_times, 95) * 1000
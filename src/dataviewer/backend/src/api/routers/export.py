@@ -221,6 +221,19 @@ async def export_episodes(
         )
 
 
+def _format_progress_event(progress: ExportProgress) -> str:
+    """Format an export progress update as an SSE progress event."""
+    progress_data = {
+        "currentEpisode": progress.current_episode,
+        "totalEpisodes": progress.total_episodes,
+        "currentFrame": progress.current_frame,
+        "totalFrames": progress.total_frames,
+        "percentage": progress.percentage,
+        "status": progress.status,
+    }
+    return f"event: progress\ndata: {json.dumps(progress_data)}\n\n"
+
+
 @router.post("/{dataset_id}/export/stream", dependencies=[Depends(require_auth), Depends(require_csrf_token)])
 async def export_episodes_stream(
     dataset_id: str = Depends(validated_dataset_id),
@@ -317,18 +330,15 @@ async def export_episodes_stream(
                         }
                     )
 
-            # Queue for progress updates
+            # Queue for progress updates; None marks the end of the export
             progress_queue: asyncio.Queue[ExportProgress | None] = asyncio.Queue()
+            loop = asyncio.get_running_loop()
 
             def progress_callback(progress: ExportProgress):
-                # Non-blocking put
-                import contextlib
-
-                with contextlib.suppress(asyncio.QueueFull):
-                    progress_queue.put_nowait(progress)
+                # Called from the executor thread, so hand off to the event loop
+                loop.call_soon_threadsafe(progress_queue.put_nowait, progress)
 
             # Run export in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
             export_task = loop.run_in_executor(
                 None,
                 lambda: exporter.export_episodes(
@@ -337,47 +347,15 @@ async def export_episodes_stream(
                     progress_callback=progress_callback,
                 ),
             )
+            export_task.add_done_callback(lambda _: progress_queue.put_nowait(None))
 
-            # Stream progress updates
-            while not export_task.done():
-                try:
-                    progress = await asyncio.wait_for(
-                        progress_queue.get(),
-                        timeout=0.5,
-                    )
-                    if progress:
-                        progress_data = {
-                            "currentEpisode": progress.current_episode,
-                            "totalEpisodes": progress.total_episodes,
-                            "currentFrame": progress.current_frame,
-                            "totalFrames": progress.total_frames,
-                            "percentage": progress.percentage,
-                            "status": progress.status,
-                        }
-                        yield f"event: progress\ndata: {json.dumps(progress_data)}\n\n"
-                except TimeoutError:
-                    continue
+            # Stream progress updates as they arrive
+            while (progress := await progress_queue.get()) is not None:
+                yield _format_progress_event(progress)
 
             # Get final result
             result = await export_task
 
-            # Drain any remaining progress updates
-            while not progress_queue.empty():
-                try:
-                    progress = progress_queue.get_nowait()
-                    if progress:
-                        progress_data = {
-                            "currentEpisode": progress.current_episode,
-                            "totalEpisodes": progress.total_episodes,
-                            "currentFrame": progress.current_frame,
-                            "totalFrames": progress.total_frames,
-                            "percentage": progress.percentage,
-                            "status": progress.status,
-                        }
-                        yield f"event: progress\ndata: {json.dumps(progress_data)}\n\n"
-                except asyncio.QueueEmpty:
-                    break
-
             # Send completion event
             complete_data = {
                 "success": result.success,
@@ -5,6 +5,7 @@ Automatically detects anomalies in robot trajectories using
 statistical methods and threshold-based detection.
 """
 
+import bisect
 import uuid
 from dataclasses import dataclass
 from enum import StrEnum
@@ -254,44 +255,50 @@ class AnomalyDetector:
         if len(positions) < 20:
             return anomalies
 
-        # Detect sign changes in velocity for each joint
+        # Detect sign changes in velocity for all joints at once
         velocity = np.diff(positions, axis=0)
+        sign_changes = np.diff(np.sign(velocity), axis=0) != 0
 
-        for joint_idx in range(positions.shape[1]):
-            joint_vel = velocity[:, joint_idx]
-            sign_changes = np.diff(np.sign(joint_vel))
-            zero_crossings = np.where(sign_changes != 0)[0]
+        # Accepted ranges are disjoint, so sorted starts imply sorted ends
+        range_starts: list[int] = []
+        range_ends: list[int] = []
 
-            # Look for rapid oscillations (multiple sign changes in short window)
-            window_size = 20
-            for i in range(0, len(zero_crossings) - self.oscillation_min_cycles):
-                window_crossings = zero_crossings[
-                    (zero_crossings >= zero_crossings[i]) & (zero_crossings < zero_crossings[i] + window_size)
-                ]
-
-                if len(window_crossings) >= self.oscillation_min_cycles * 2:
-                    start_frame = int(window_crossings[0])
-                    end_frame = int(window_crossings[-1]) + 1
-
-                    # Check if we already have an overlapping anomaly
-                    overlaps = any(
-                        a.type == AnomalyType.OSCILLATION
-                        and a.frame_range[0] <= end_frame
-                        and a.frame_range[1] >= start_frame
-                        for a in anomalies
-                    )
+        # Joints without enough crossings for a single window cannot oscillate
+        min_crossings = self.oscillation_min_cycles * 2
+        candidate_joints = np.flatnonzero(sign_changes.sum(axis=0) >= min_crossings)
 
-                    if not overlaps:
-                        anomalies.append(
-                            DetectedAnomaly(
-                                id=str(uuid.uuid4()),
-                                type=AnomalyType.OSCILLATION,
-                                severity=AnomalySeverity.MEDIUM,
-                                frame_range=(start_frame, end_frame),
-                                description=f"Oscillation detected in joint {joint_idx + 1}",
-                                confidence=0.7,
-                            )
+        for joint_idx in candidate_joints.tolist():
+            zero_crossings = np.flatnonzero(sign_changes[:, joint_idx])
+
+            # Look for rapid oscillations (multiple sign changes in short window).
+            # Crossings are sorted, so each window is zero_crossings[i:window_ends[i]].
+            window_size = 20
+            num_starts = max(len(zero_crossings) - self.oscillation_min_cycles, 0)
+            window_ends = np.searchsorted(zero_crossings, zero_crossings[:num_starts] + window_size)
+            window_starts = np.flatnonzero(window_ends - np.arange(num_starts) >= min_crossings)
+
+            for i in window_starts.tolist():
+                start_frame = int(zero_crossings[i])
+                end_frame = int(zero_crossings[window_ends[i] - 1]) + 1
+
+                # Check if we already have an overlapping anomaly; only the latest
+                # range starting at or before end_frame can reach start_frame
+                pos = bisect.bisect_right(range_starts, end_frame)
+                overlaps = pos > 0 and range_ends[pos - 1] >= start_frame
+
+                if not overlaps:
+                    range_starts.insert(pos, start_frame)
+                    range_ends.insert(pos, end_frame)
+                    anomalies.append(
+                        DetectedAnomaly(
+                            id=str(uuid.uuid4()),
+                            type=AnomalyType.OSCILLATION,
+                            severity=AnomalySeverity.MEDIUM,
+                            frame_range=(start_frame, end_frame),
+                            description=f"Oscillation detected in joint {joint_idx + 1}",
+                            confidence=0.7,
                         )
+                    )
 
         return anomalies
 
@@ -376,19 +383,15 @@ class AnomalyDetector:
         Detect when joints approach their limits.
         """
         anomalies = []
-        lower_limits, upper_limits = joint_limits
-
-        for joint_idx in range(positions.shape[1]):
-            joint_positions = positions[:, joint_idx]
-            lower = lower_limits[joint_idx]
-            upper = upper_limits[joint_idx]
-            margin = (upper - lower) * self.joint_limit_margin
-
-            near_lower = joint_positions < (lower + margin)
-            near_upper = joint_positions > (upper - margin)
-            near_limit = near_lower | near_upper
-
-            limit_indices = np.where(near_limit)[0]
+        # Limits may arrive as plain lists; convert once and test all joints by broadcasting
+        lower_limits = np.asarray(joint_limits[0], dtype=np.float64)
+        upper_limits = np.asarray(joint_limits[1], dtype=np.float64)
+        margin = (upper_limits - lower_limits) * self.joint_limit_margin
+        near_limit = (positions < lower_limits + margin) | (positions > upper_limits - margin)
+
+        # Only joints that actually reach a margin need grouping
+        for joint_idx in np.flatnonzero(near_limit.any(axis=0)).tolist():
+            limit_indices = np.flatnonzero(near_limit[:, joint_idx])
             groups = self._group_consecutive(limit_indices)
 
             for group in groups:
@@ -8,6 +8,7 @@ and LeRobot parquet-format datasets.
 
 import logging
 import os
+from collections import OrderedDict
 from pathlib import Path
 
 from ..models.datasources import (
@@ -44,6 +45,9 @@ except ImportError:
     LeRobotLoader = None
     is_lerobot_dataset = lambda x: False  # noqa: E731
 
+# Number of encoded JPEG frames kept in memory for repeat requests
+FRAME_CACHE_SIZE = 256
+
 
 class DatasetService:
     """
@@ -69,6 +73,7 @@ class DatasetService:
         self._storage = LocalStorageAdapter(base_path)
         self._hdf5_loaders: dict[str, HDF5Loader] = {}
         self._lerobot_loaders: dict[str, LeRobotLoader] = {}
+        self._frame_cache: OrderedDict[tuple[str, int, int, str], bytes] = OrderedDict()
 
     def _get_lerobot_loader(self, dataset_id: str) -> LeRobotLoader | None:
         """
@@ -712,6 +717,23 @@ class DatasetService:
         """
         dataset_id = dataset_id.replace("\r\n", "").replace("\n", "")
         camera = camera.replace("\r\n", "").replace("\n", "")
+
+        # Scrubbing and playback revisit the same frames; serve them without re-decoding
+        cache_key = (dataset_id, episode_idx, frame_idx, camera)
+        cached = self._frame_cache.get(cache_key)
+        if cached is not None:
+            self._frame_cache.move_to_end(cache_key)
+            return cached
+
+        image = self._load_frame_image(dataset_id, episode_idx, frame_idx, camera)
+        if image is not None:
+            self._frame_cache[cache_key] = image
+            if len(self._frame_cache) > FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        return image
+
+    def _load_frame_image(self, dataset_id: str, episode_idx: int, frame_idx: int, camera: str) -> bytes | None:
+        """Decode and JPEG-encode a single frame from the dataset's loader."""
         # Try LeRobot loader first (mp4 frame extraction)
         lerobot_loader = self._get_lerobot_loader(dataset_id)
         if lerobot_loader is not None:
@@ -770,10 +792,7 @@ class DatasetService:
     ) -> bytes | None:
         """Extract a single JPEG frame from a LeRobot mp4 video using OpenCV."""
         camera = camera.replace("\r\n", "").replace("\n", "")
-        import io
-
         import cv2
-        from PIL import Image
 
         video_path = loader.get_video_path(episode_idx, camera)
         if video_path is None:
@@ -794,10 +813,15 @@ class DatasetService:
                 )
                 return None
 
-            img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            buf = io.BytesIO()
-            img.save(buf, format="JPEG", quality=85)
-            return buf.getvalue()
+            # Encode the decoded BGR frame directly; no RGB conversion or PIL round-trip
+            ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            if not ok:
+                logger.warning(
+                    "Failed to encode frame %s",
+                    str(frame_idx).replace("\r\n", "").replace("\n", ""),
+                )
+                return None
+            return encoded.tobytes()
         finally:
             cap.release()
 
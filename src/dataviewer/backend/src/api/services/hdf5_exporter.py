@@ -454,15 +454,13 @@ class HDF5Exporter:
         if not insertions:
             return data
 
-        # Sort by position descending to avoid index shifting
-        sorted_insertions = sorted(insertions, key=lambda x: x[0], reverse=True)
+        positions = np.array([after_pos for after_pos, _ in insertions])
+        # Order by position; rows sharing a position keep the latest-requested first
+        order = np.lexsort((-np.arange(len(insertions)), positions))
+        rows = np.stack([insertions[i][1] for i in order])
 
-        result = data
-        for after_pos, new_row in sorted_insertions:
-            # Insert after the position (so at index after_pos + 1)
-            result = np.insert(result, after_pos + 1, new_row, axis=0)
-
-        return result
+        # Single copy: insert every row after its position (so at index after_pos + 1)
+        return np.insert(data, positions[order] + 1, rows, axis=0)
 
     def _export_trajectory_data(
         self,
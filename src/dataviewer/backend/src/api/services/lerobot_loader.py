@@ -24,6 +24,8 @@ logger = logging.getLogger(__name__)
 
 # PyArrow is an optional dependency
 try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
     import pyarrow.parquet as pq
 
     PARQUET_AVAILABLE = True
@@ -128,6 +130,8 @@ class LeRobotLoader:
         self.base_path = Path(base_path)
         self._info: LeRobotDatasetInfo | None = None
         self._episode_index_cache: dict[int, tuple[int, int]] = {}  # episode -> (chunk, file)
+        self._episode_info_cache: dict[int, dict[str, Any]] = {}
+        self._data_files: list[tuple[int, int, Path]] | None = None
 
     def _load_info(self) -> LeRobotDatasetInfo:
         """Load and cache dataset info from meta/info.json."""
@@ -203,32 +207,46 @@ class LeRobotLoader:
 
         if not full_path.exists():
             # Try searching all data files
-            data_dir = self.base_path / "data"
-            if data_dir.exists():
-                for chunk_dir in sorted(data_dir.iterdir()):
-                    if chunk_dir.is_dir() and chunk_dir.name.startswith("chunk-"):
-                        for parquet_file in chunk_dir.glob("*.parquet"):
-                            try:
-                                table = pq.read_table(parquet_file)
-                                df = table.to_pandas()
-                                if "episode_index" in df.columns:
-                                    episodes_in_file = df["episode_index"].unique()
-                                    if episode_index in episodes_in_file:
-                                        chunk_num = int(chunk_dir.name.split("-")[1])
-                                        file_num = int(parquet_file.stem.split("-")[1])
-                                        self._episode_index_cache[episode_index] = (
-                                            chunk_num,
-                                            file_num,
-                                        )
-                                        return chunk_num, file_num
-                            except Exception:
-                                continue
+            for chunk_num, file_num, parquet_file in self._list_data_files():
+                try:
+                    if _file_contains_episode(parquet_file, episode_index):
+                        self._episode_index_cache[episode_index] = (chunk_num, file_num)
+                        return chunk_num, file_num
+                except Exception:
+                    continue
 
             raise LeRobotLoaderError(f"No data file found for episode {episode_index}")
 
         self._episode_index_cache[episode_index] = (chunk_idx, file_idx)
         return chunk_idx, file_idx
 
+    def _list_data_files(self) -> list[tuple[int, int, Path]]:
+        """
+        List data parquet files once and cache them for episode lookups.
+
+        Returns:
+            Sorted list of (chunk_index, file_index, path) tuples.
+        """
+        if self._data_files is not None:
+            return self._data_files
+
+        data_files: list[tuple[int, int, Path]] = []
+        data_dir = self.base_path / "data"
+        if data_dir.exists():
+            for chunk_dir in sorted(data_dir.iterdir()):
+                if not (chunk_dir.is_dir() and chunk_dir.name.startswith("chunk-")):
+                    continue
+                for parquet_file in sorted(chunk_dir.glob("*.parquet")):
+                    try:
+                        chunk_num = int(chunk_dir.name.split("-")[1])
+                        file_num = int(parquet_file.stem.split("-")[1])
+                    except (IndexError, ValueError):
+                        continue
+                    data_files.append((chunk_num, file_num, parquet_file))
+
+        self._data_files = data_files
+        return data_files
+
     def _format_path(self, template: str, chunk_index: int, file_index: int, video_key: str = "") -> str:
         """Format a path template with indices."""
         return template.format(chunk_index=chunk_index, file_index=file_index, video_key=video_key)
@@ -265,51 +283,53 @@ class LeRobotLoader:
 
         try:
             table = pq.read_table(full_path)
-            df = table.to_pandas()
 
             # Filter to requested episode
-            if "episode_index" in df.columns:
-                df = df[df["episode_index"] == episode_index]
+            if "episode_index" in table.column_names:
+                table = table.filter(pc.equal(table["episode_index"], episode_index))
 
-            if df.empty:
+            if table.num_rows == 0:
                 raise LeRobotLoaderError(f"Episode {episode_index} not found in {full_path}")
 
             # Sort by frame_index
-            if "frame_index" in df.columns:
-                df = df.sort_values("frame_index")
+            if "frame_index" in table.column_names:
+                table = table.sort_by("frame_index")
 
-            length = len(df)
+            columns = table.column_names
+            length = table.num_rows
 
             # Extract timestamps
-            timestamps = df["timestamp"].values if "timestamp" in df.columns else np.arange(length) / info.fps
+            timestamps = (
+                _column_to_numpy(table, "timestamp") if "timestamp" in columns else np.arange(length) / info.fps
+            )
 
             # Extract frame indices
-            frame_indices = df["frame_index"].values if "frame_index" in df.columns else np.arange(length)
+            frame_indices = _column_to_numpy(table, "frame_index") if "frame_index" in columns else np.arange(length)
 
             # Extract observation state (joint positions)
             joint_positions: NDArray[np.float64]
-            if "observation.state" in df.columns:
-                joint_positions = np.stack(df["observation.state"].values)
-            elif "qpos" in df.columns:
-                joint_positions = np.stack(df["qpos"].values)
+            if "observation.state" in columns:
+                joint_positions = _column_to_numpy(table, "observation.state")
+            elif "qpos" in columns:
+                joint_positions = _column_to_numpy(table, "qpos")
             else:
                 # Create zeros if no state data
                 joint_positions = np.zeros((length, 6), dtype=np.float64)
 
             # Extract joint velocities if available
             joint_velocities: NDArray[np.float64] | None = None
-            if "observation.velocity" in df.columns:
-                joint_velocities = np.stack(df["observation.velocity"].values)
-            elif "qvel" in df.columns:
-                joint_velocities = np.stack(df["qvel"].values)
+            if "observation.velocity" in columns:
+                joint_velocities = _column_to_numpy(table, "observation.velocity")
+            elif "qvel" in columns:
+                joint_velocities = _column_to_numpy(table, "qvel")
 
             # Extract actions
             actions: NDArray[np.float64] = (
-                np.stack(df["action"].values) if "action" in df.columns else np.zeros_like(joint_positions)
+                _column_to_numpy(table, "action") if "action" in columns else np.zeros_like(joint_positions)
             )
 
             # Get task index
-            task_index = int(df["task_index"].iloc[0]) if "task_index" in df.columns else 0
+            task_index = int(table["task_index"][0].as_py()) if "task_index" in columns else 0
 
             # Find video paths
             video_paths: dict[str, Path] = {}
@@ -324,11 +344,11 @@ class LeRobotLoader:
             return LeRobotEpisodeData(
                 episode_index=episode_index,
                 length=length,
-                timestamps=timestamps.astype(np.float64),
-                frame_indices=frame_indices.astype(np.int64),
-                joint_positions=joint_positions.astype(np.float64),
+                timestamps=timestamps.astype(np.float64, copy=False),
+                frame_indices=frame_indices.astype(np.int64, copy=False),
+                joint_positions=joint_positions.astype(np.float64, copy=False),
                 joint_velocities=joint_velocities,
-                actions=actions.astype(np.float64),
+                actions=actions.astype(np.float64, copy=False),
                 task_index=task_index,
                 video_paths=video_paths,
                 metadata={
@@ -353,6 +373,10 @@ class LeRobotLoader:
         Returns:
             Dictionary with episode metadata.
         """
+        # Episode listings request this for every episode on every page load
+        if episode_index in self._episode_info_cache:
+            return dict(self._episode_info_cache[episode_index])
+
         info = self._load_info()
         chunk_idx, file_idx = self._find_episode_location(episode_index)
 
@@ -361,14 +385,14 @@ class LeRobotLoader:
         full_path = self.base_path / data_path
 
         try:
-            table = pq.read_table(full_path)
-            df = table.to_pandas()
+            schema_names = pq.read_schema(full_path).names
+            table = pq.read_table(full_path, columns=[c for c in ("episode_index", "task_index") if c in schema_names])
 
-            if "episode_index" in df.columns:
-                df = df[df["episode_index"] == episode_index]
+            if "episode_index" in table.column_names:
+                table = table.filter(pc.equal(table["episode_index"], episode_index))
 
-            length = len(df)
-            task_index = int(df["task_index"].iloc[0]) if "task_index" in df.columns else 0
+            length = table.num_rows
+            task_index = int(table["task_index"][0].as_py()) if "task_index" in table.column_names and length else 0
 
             # Find cameras from video features
             cameras: list[str] = []
@@ -376,7 +400,7 @@ class LeRobotLoader:
                 if feature_info.get("dtype") == "video":
                     cameras.append(feature_name)
 
-            return {
+            self._episode_info_cache[episode_index] = {
                 "episode_index": episode_index,
                 "length": length,
                 "fps": info.fps,
@@ -384,6 +408,7 @@ class LeRobotLoader:
                 "task_index": task_index,
                 "robot_type": info.robot_type,
             }
+            return dict(self._episode_info_cache[episode_index])
 
         except Exception as e:
             raise LeRobotLoaderError(f"Failed to get info for episode {episode_index}: {e}", cause=e)
@@ -424,6 +449,50 @@ class LeRobotLoader:
         return cameras
 
 
+def _file_contains_episode(path: Path, episode_index: int) -> bool:
+    """
+    Check whether a data parquet file holds rows for an episode.
+
+    Row groups whose episode_index min/max statistics exclude the episode are
+    skipped without decoding; candidate row groups read only that column.
+    """
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    column_paths = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+    if "episode_index" not in column_paths:
+        return False
+    column_idx = column_paths.index("episode_index")
+
+    for rg_idx in range(metadata.num_row_groups):
+        stats = metadata.row_group(rg_idx).column(column_idx).statistics
+        if stats is not None and stats.has_min_max and not stats.min <= episode_index <= stats.max:
+            continue
+        row_group = parquet_file.read_row_group(rg_idx, columns=["episode_index"])
+        if pc.any(pc.equal(row_group["episode_index"], episode_index)).as_py():
+            return True
+    return False
+
+
+def _column_to_numpy(table: "pa.Table", name: str) -> NDArray[Any]:
+    """
+    Convert a parquet column to a numpy array without going through pandas.
+
+    Fixed-size, variable, and large list columns (e.g. observation.state) are
+    flattened into their contiguous child values and reshaped to (N, dim); an
+    empty column yields shape (0, 0). Lists of lists have no flat child buffer
+    and fall back to ``to_pylist``. Nullable columns are converted with nulls
+    as NaN rather than raising.
+    """
+    column = table[name].combine_chunks()
+    if pa.types.is_list(column.type) or pa.types.is_large_list(column.type) or pa.types.is_fixed_size_list(column.type):
+        values = column.flatten()
+        if pa.types.is_nested(values.type):
+            return np.array(column.to_pylist())
+        flat = values.to_numpy(zero_copy_only=False)
+        return flat.reshape(len(column), len(flat) // max(len(column), 1))
+    return column.to_numpy(zero_copy_only=False)
+
+
 def is_lerobot_dataset(path: str | Path) -> bool:
     """
     Check if a path contains a LeRobot parquet-format dataset.
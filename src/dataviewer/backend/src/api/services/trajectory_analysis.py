@@ -106,12 +106,15 @@ class TrajectoryAnalyzer:
         acceleration = np.diff(velocity, axis=0) / dt[1:, np.newaxis]
         jerk = np.diff(acceleration, axis=0) / dt[2:, np.newaxis]
 
+        # Velocity magnitude is shared by the jitter, hesitation, and correction metrics
+        vel_magnitude = np.linalg.norm(velocity, axis=1)
+
         # Compute metrics
         smoothness = self._compute_smoothness(jerk)
         efficiency = self._compute_efficiency(positions)
-        jitter = self._compute_jitter(velocity, timestamps)
-        hesitation_count = self._count_hesitations(velocity)
-        correction_count = self._count_corrections(velocity)
+        jitter = self._compute_jitter(vel_magnitude, timestamps)
+        hesitation_count = self._count_hesitations(vel_magnitude)
+        correction_count = self._count_corrections(velocity, vel_magnitude)
 
         # Determine flags
         flags = self._determine_flags(smoothness, jitter, hesitation_count, correction_count)
@@ -168,30 +171,27 @@ class TrajectoryAnalyzer:
 
     def _compute_jitter(
         self,
-        velocity: NDArray[np.float64],
+        vel_magnitude: NDArray[np.float64],
         timestamps: NDArray[np.float64],
     ) -> float:
         """
         Compute jitter as high-frequency oscillation amplitude.
 
-        Uses FFT to detect high-frequency components.
+        Uses FFT of the per-frame velocity magnitude to detect high-frequency components.
         """
-        if len(velocity) < 10:
+        if len(vel_magnitude) < 10:
             return 0.0
 
         try:
             # Use scipy if available, otherwise basic numpy
             from scipy import fft as scipy_fft
 
-            # Compute velocity magnitude
-            vel_magnitude = np.linalg.norm(velocity, axis=1)
-
             # FFT of velocity
             n = len(vel_magnitude)
             freq_spectrum = np.abs(scipy_fft.fft(vel_magnitude))[: n // 2]
 
             # Estimate sample rate
-            avg_dt = np.mean(np.diff(timestamps[: len(velocity) + 1]))
+            avg_dt = np.mean(np.diff(timestamps[: len(vel_magnitude) + 1]))
             if avg_dt <= 0:
                 avg_dt = 1.0 / 30.0  # Default 30 FPS
 
@@ -212,32 +212,19 @@ class TrajectoryAnalyzer:
             # Fallback without scipy
             return 0.0
 
-    def _count_hesitations(self, velocity: NDArray[np.float64]) -> int:
+    def _count_hesitations(self, vel_magnitude: NDArray[np.float64]) -> int:
         """
-        Count segments where velocity was near zero.
+        Count segments where velocity magnitude was near zero.
         """
-        vel_magnitude = np.linalg.norm(velocity, axis=1)
         is_stopped = vel_magnitude < self.velocity_threshold
 
-        # Find consecutive stopped segments
-        hesitation_count = 0
-        consecutive = 0
-
-        for stopped in is_stopped.tolist():
-            if stopped:
-                consecutive += 1
-            else:
-                if consecutive >= self.hesitation_min_frames:
-                    hesitation_count += 1
-                consecutive = 0
-
-        # Check final segment
-        if consecutive >= self.hesitation_min_frames:
-            hesitation_count += 1
+        # Find consecutive stopped segments from the edges of the zero-padded mask
+        edges = np.diff(np.concatenate(([0], is_stopped.astype(np.int8), [0])))
+        run_lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
 
-        return hesitation_count
+        return int(np.count_nonzero(run_lengths >= self.hesitation_min_frames))
 
-    def _count_corrections(self, velocity: NDArray[np.float64]) -> int:
+    def _count_corrections(self, velocity: NDArray[np.float64], vel_magnitude: NDArray[np.float64]) -> int:
         """
         Count direction reversal events.
         """
@@ -245,7 +232,7 @@ class TrajectoryAnalyzer:
             return 0
 
         # Compute velocity direction changes
-        vel_normalized = velocity / (np.linalg.norm(velocity, axis=1, keepdims=True) + 1e-10)
+        vel_normalized = velocity / (vel_magnitude[:, np.newaxis] + 1e-10)
 
         # Dot product between consecutive velocity directions
         dot_products = np.sum(vel_normalized[:-1] * vel_normalized[1:], axis=1)
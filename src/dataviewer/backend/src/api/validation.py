@@ -10,6 +10,7 @@ from fastapi import Path as PathParam
 SAFE_DATASET_ID_PATTERN = r"^[a-zA-Z0-9][a-zA-Z0-9._-]{0,254}$"
 SAFE_CAMERA_NAME_PATTERN = r"^[a-zA-Z0-9][a-zA-Z0-9._-]{0,127}$"
 
+# Compiled once at import; fullmatch() keeps `$` from accepting a trailing newline
 _DATASET_ID_RE = re.compile(SAFE_DATASET_ID_PATTERN)
 _CAMERA_NAME_RE = re.compile(SAFE_CAMERA_NAME_PATTERN)
 
@@ -20,7 +21,7 @@ def validated_dataset_id(
     """FastAPI dependency that validates dataset_id path parameters."""
     if "\x00" in dataset_id or dataset_id in (".", "..") or "/" in dataset_id or "\\" in dataset_id:
         raise HTTPException(status_code=400, detail=f"Invalid dataset_id: '{dataset_id}'")
-    if not _DATASET_ID_RE.match(dataset_id):
+    if not _DATASET_ID_RE.fullmatch(dataset_id):
         raise HTTPException(status_code=400, detail=f"Invalid dataset_id: '{dataset_id}'")
     return dataset_id
 
@@ -31,7 +32,7 @@ def validated_camera_name(
     """FastAPI dependency that validates camera name path parameters."""
     if "\x00" in camera or camera in (".", "..") or "/" in camera or "\\" in camera:
         raise HTTPException(status_code=400, detail=f"Invalid camera name: '{camera}'")
-    if not _CAMERA_NAME_RE.match(camera):
+    if not _CAMERA_NAME_RE.fullmatch(camera):
         raise HTTPException(status_code=400, detail=f"Invalid camera name: '{camera}'")
     return camera
 
@@ -52,6 +52,14 @@ class TestTrajectoryAnalyzer:
         assert metrics.smoothness == 1.0
         assert metrics.overall_score == 3
 
+    def test_synthetic_hesitations(self):
+        """Only stopped runs of at least hesitation_min_frames are counted."""
+        analyzer = TrajectoryAnalyzer(hesitation_min_frames=3)
+        moving = np.ones(4)
+        stopped = np.zeros(3)
+        vel_magnitude = np.concatenate([stopped, moving, stopped[:2], moving, stopped])
+        assert analyzer._count_hesitations(vel_magnitude) == 2
+
     def test_multiple_episodes_produce_valid_scores(self, loader):
         analyzer = TrajectoryAnalyzer()
         for idx in [0, 15, 30, 63]:
@@ -88,6 +96,19 @@ class TestAnomalyDetector:
         types = [a.type.value for a in anomalies]
         assert "velocity_spike" in types
 
+    def test_synthetic_joint_limit(self):
+        """Dwelling near a limit should be flagged only for that joint."""
+        n = 100
+        timestamps = np.linspace(0, 3.0, n)
+        positions = np.zeros((n, 6))
+        positions[40:50, 2] = 0.99
+
+        detector = AnomalyDetector()
+        anomalies = detector.detect(positions, timestamps, joint_limits=([-1.0] * 6, [1.0] * 6))
+        limits = [a for a in anomalies if a.type.value == "joint_limit"]
+        assert [a.frame_range for a in limits] == [(40, 50)]
+        assert limits[0].description == "Joint 3 near limit"
+
 
 class TestAIAnalysisEndpoints:
     """Integration tests for the /api/ai/* endpoints using real data."""
@@ -9,7 +9,7 @@ import os
 
 import pytest
 
-from src.api.services.dataset_service import DatasetService
+from src.api.services.dataset_service import FRAME_CACHE_SIZE, DatasetService
 
 from .conftest import TEST_DATASET_ID
 
@@ -187,3 +187,52 @@ class TestVideoFilePath:
         service._discover_dataset(DATASET_ID)
         path = service.get_video_file_path(DATASET_ID, 0, "fake_camera")
         assert path is None
+
+
+class TestFrameCache:
+    """Test the LRU cache in front of frame decoding."""
+
+    @pytest.fixture
+    def loads(self, tmp_path, monkeypatch):
+        """Service whose frame loader is stubbed to count calls."""
+        service = DatasetService(base_path=str(tmp_path))
+        calls = []
+
+        def fake_load(dataset_id, episode_idx, frame_idx, camera):
+            calls.append((dataset_id, episode_idx, frame_idx, camera))
+            return None if camera == "missing" else f"{episode_idx}:{frame_idx}".encode()
+
+        monkeypatch.setattr(service, "_load_frame_image", fake_load)
+        return service, calls
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_from_cache(self, loads):
+        service, calls = loads
+        first = await service.get_frame_image("ds", 0, 5, "cam")
+        second = await service.get_frame_image("ds", 0, 5, "cam")
+        assert first == second == b"0:5"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, loads):
+        service, calls = loads
+        for frame_idx in range(FRAME_CACHE_SIZE):
+            await service.get_frame_image("ds", 0, frame_idx, "cam")
+        # Touch frame 0 so frame 1 becomes the least recently used entry
+        await service.get_frame_image("ds", 0, 0, "cam")
+        await service.get_frame_image("ds", 0, FRAME_CACHE_SIZE, "cam")
+        assert len(service._frame_cache) == FRAME_CACHE_SIZE
+        assert ("ds", 0, 0, "cam") in service._frame_cache
+        assert ("ds", 0, 1, "cam") not in service._frame_cache
+
+        calls.clear()
+        await service.get_frame_image("ds", 0, 1, "cam")
+        assert calls == [("ds", 0, 1, "cam")]
+
+    @pytest.mark.asyncio
+    async def test_missing_frame_not_cached(self, loads):
+        service, calls = loads
+        assert await service.get_frame_image("ds", 0, 0, "missing") is None
+        assert await service.get_frame_image("ds", 0, 0, "missing") is None
+        assert len(calls) == 2
+        assert not service._frame_cache
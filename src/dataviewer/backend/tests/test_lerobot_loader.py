@@ -5,14 +5,18 @@ Tests dataset info loading, episode listing, episode data loading,
 video path resolution, and camera discovery.
 """
 
+import json
 import os
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from src.api.services.lerobot_loader import (
     LeRobotLoader,
     LeRobotLoaderError,
+    _column_to_numpy,
     is_lerobot_dataset,
 )
 
@@ -208,3 +212,93 @@ class TestVideoAndCameras:
     def test_get_cameras(self, loader):
         cameras = loader.get_cameras()
         assert cameras == ["observation.images.il-camera"]
+
+
+class TestColumnToNumpy:
+    """Arrow column conversion used by load_episode."""
+
+    def test_list_types_reshape_to_rows(self):
+        rows = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        table = pa.table(
+            {
+                "list": pa.chunked_array([rows[:2], rows[2:]], type=pa.list_(pa.float64())),
+                "large_list": pa.array(rows, type=pa.large_list(pa.float64())),
+                "fixed": pa.array(rows, type=pa.list_(pa.float32(), 2)),
+            }
+        )
+        for name in ("list", "large_list", "fixed"):
+            np.testing.assert_array_equal(_column_to_numpy(table, name), np.array(rows))
+
+    def test_nested_list_falls_back_to_pylist(self):
+        table = pa.table({"nested": pa.array([[[1.0], [2.0]], [[3.0], [4.0]]])})
+        np.testing.assert_array_equal(_column_to_numpy(table, "nested"), [[[1.0], [2.0]], [[3.0], [4.0]]])
+
+    def test_empty_list_column_has_zero_rows(self):
+        table = pa.table({"state": pa.array([], type=pa.list_(pa.float32(), 6))})
+        assert _column_to_numpy(table, "state").shape == (0, 0)
+
+    def test_nullable_scalar_column_becomes_nan(self):
+        table = pa.table({"timestamp": pa.array([0.0, None, 0.2])})
+        values = _column_to_numpy(table, "timestamp")
+        assert np.isnan(values[1])
+        np.testing.assert_array_equal(values[[0, 2]], [0.0, 0.2])
+
+
+@pytest.fixture
+def multi_episode_dir(tmp_path):
+    """Dataset with several episodes packed into one non-default data file.
+
+    Rows are split across row groups and frame_index runs backwards within
+    each episode so lookups must scan the file and sort.
+    """
+    (tmp_path / "meta").mkdir()
+    (tmp_path / "meta" / "info.json").write_text(json.dumps({"fps": 30, "total_episodes": 3, "features": {}}))
+
+    episodes, frames = [], []
+    for episode_index, length in ((10, 4), (11, 6), (12, 3)):
+        episodes += [episode_index] * length
+        frames += list(reversed(range(length)))
+    state = [[float(e * 100 + f)] * 6 for e, f in zip(episodes, frames, strict=True)]
+    table = pa.table(
+        {
+            "episode_index": pa.array(episodes, type=pa.int64()),
+            "frame_index": pa.array(frames, type=pa.int64()),
+            "timestamp": pa.array([f / 30 for f in frames], type=pa.float32()),
+            "task_index": pa.array([0] * len(episodes), type=pa.int64()),
+            "observation.state": pa.array(state, type=pa.list_(pa.float32(), 6)),
+            "action": pa.array([row[:2] for row in state], type=pa.list_(pa.float32())),
+        }
+    )
+    data_dir = tmp_path / "data" / "chunk-020"
+    data_dir.mkdir(parents=True)
+    pq.write_table(table, data_dir / "file-003.parquet", row_group_size=4)
+    return tmp_path
+
+
+class TestMultiEpisodeFile:
+    """Episode lookup in data files holding several episodes."""
+
+    def test_load_episode_selects_rows_in_frame_order(self, multi_episode_dir):
+        episode = LeRobotLoader(multi_episode_dir).load_episode(11)
+        assert episode.length == 6
+        np.testing.assert_array_equal(episode.frame_indices, np.arange(6))
+        np.testing.assert_allclose(episode.timestamps, np.arange(6) / 30, rtol=1e-6)
+        expected = 1100.0 + np.arange(6)
+        np.testing.assert_array_equal(episode.joint_positions, np.repeat(expected[:, None], 6, axis=1))
+        np.testing.assert_array_equal(episode.actions, np.repeat(expected[:, None], 2, axis=1))
+
+    def test_get_episode_info_length(self, multi_episode_dir):
+        loader = LeRobotLoader(multi_episode_dir)
+        assert [loader.get_episode_info(e)["length"] for e in (10, 11, 12)] == [4, 6, 3]
+
+    def test_data_file_listing_is_cached(self, multi_episode_dir):
+        loader = LeRobotLoader(multi_episode_dir)
+        loader.get_episode_info(10)
+        files = loader._list_data_files()
+        assert [(c, f) for c, f, _ in files] == [(20, 3)]
+        loader.load_episode(12)
+        assert loader._list_data_files() is files
+
+    def test_missing_episode_raises(self, multi_episode_dir):
+        with pytest.raises(LeRobotLoaderError, match="No data file found for episode 13"):
+            LeRobotLoader(multi_episode_dir).load_episode(13)
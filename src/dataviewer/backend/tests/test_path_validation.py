@@ -40,6 +40,7 @@ class TestValidatedDatasetId:
             "..",
             "valid/../escape",
             "%2e%2e%2f",
+            "dataset\n",
         ],
     )
     def test_traversal_dataset_ids_rejected(self, dataset_id):
@@ -69,6 +70,7 @@ class TestValidatedCameraName:
             "../../../etc/passwd",
             "camera/../../secret",
             "cam\x00era",
+            "camera\n",
         ],
     )
     def test_traversal_camera_names_rejected(self, camera):
@@ -74,6 +74,9 @@ class ACTInferenceNode(Node):
         self.declare_parameter("enable_control", False)
         self.declare_parameter("camera_topic", "/camera/color/image_raw")
         self.declare_parameter("joint_states_topic", "/joint_states")
+        self.declare_parameter("compile_model", False)
+        self.declare_parameter("cuda_graphs", False)
+        self.declare_parameter("precision", "fp32")
 
         policy_repo = self.get_parameter("policy_repo").value
         device = self.get_parameter("device").value
@@ -82,16 +85,27 @@ class ACTInferenceNode(Node):
         self._enable_control = self.get_parameter("enable_control").value
         camera_topic = self.get_parameter("camera_topic").value
         joint_states_topic = self.get_parameter("joint_states_topic").value
+        compile_model = self.get_parameter("compile_model").value
+        cuda_graphs = self.get_parameter("cuda_graphs").value
+        precision = self.get_parameter("precision").value
 
         self.get_logger().info(f"Loading policy: {policy_repo}")
-        self._runner = PolicyRunner.from_pretrained(policy_repo, device=device)
-        self.get_logger().info(f"Policy loaded on {self._runner.device}")
+        self._runner = PolicyRunner.from_pretrained(
+            policy_repo,
+            device=device,
+            compile_model=compile_model,
+            cuda_graphs=cuda_graphs,
+            precision=precision,
+        )
+        self._runner.warmup()
+        self.get_logger().info(f"Policy loaded and warmed up on {self._runner.device}")
 
         self._state = RobotState()
         self._bridge = CvBridge()
 
         # Joint name → index mapping for reordering from /joint_states
         self._joint_name_to_idx: dict[str, int] = {j.value: i for i, j in enumerate(JOINT_ORDER)}
+        self._joint_names: list[str] = [j.value for j in JOINT_ORDER]
 
         # Subscribers
         sensor_qos = QoSProfile(
@@ -160,7 +174,10 @@ class ACTInferenceNode(Node):
         if img.shape[:2] != (IMAGE_HEIGHT, IMAGE_WIDTH):
             import cv2
 
-            img = cv2.resize(img, (IMAGE_WIDTH, IMAGE_HEIGHT))
+            # INTER_AREA is both faster and alias-free when shrinking the camera feed
+            shrinking = img.shape[0] > IMAGE_HEIGHT and img.shape[1] > IMAGE_WIDTH
+            interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR
+            img = cv2.resize(img, (IMAGE_WIDTH, IMAGE_HEIGHT), interpolation=interpolation)
 
         if self._state.observation is None:
             self._state.observation = RobotObservation(
@@ -189,7 +206,11 @@ class ACTInferenceNode(Node):
         if self._enable_control:
             self._publish_command(cmd)
 
-        # Publish status
+        # Publish status; only format it when someone listens or it is due for the log
+        log_due = self._state.episode_step % 30 == 0
+        if not log_due and self._status_pub.get_subscription_count() == 0:
+            return
+
         m = self._runner.metrics
         status = String()
         status.data = (
@@ -200,14 +221,14 @@ class ACTInferenceNode(Node):
         )
         self._status_pub.publish(status)
 
-        if self._state.episode_step % 30 == 0:
+        if log_due:
             self.get_logger().info(status.data)
 
     def _publish_command(self, cmd: JointPositionCommand) -> None:
         """Publish a JointTrajectory message to the UR driver."""
         traj = JointTrajectory()
         traj.header.stamp = self.get_clock().now().to_msg()
-        traj.joint_names = [j.value for j in JOINT_ORDER]
+        traj.joint_names = self._joint_names
 
         point = JointTrajectoryPoint()
         point.positions = cmd.positions.tolist()
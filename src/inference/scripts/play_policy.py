@@ -344,23 +344,33 @@ def main(
     policy = create_policy(model_path, model_format, device=env.unwrapped.device, use_gpu=args_cli.use_gpu)
 
     dt = env.unwrapped.step_dt
+    num_envs = env_cfg.scene.num_envs
 
     obs = env.get_observations()
     timestep = 0
-    total_reward = 0.0
+    # Reward totals stay on the device; they are read back only when logging
+    total_reward = torch.zeros((), dtype=torch.float64, device=env.unwrapped.device)
     episode_rewards = []
-    current_episode_reward = torch.zeros(env_cfg.scene.num_envs, device=env.unwrapped.device)
+    current_episode_reward = torch.zeros(num_envs, device=env.unwrapped.device)
 
     inference_times = []
 
     print(f"\n[INFO] Starting {model_format.upper()} policy inference...")
-    print(f"[INFO] Num envs: {env_cfg.scene.num_envs}")
+    print(f"[INFO] Num envs: {num_envs}")
     print(f"[INFO] Max steps: {args_cli.max_steps if args_cli.max_steps > 0 else 'unlimited'}")
     print("-" * 60)
 
-    while simulation_app.is_running():
-        start_time = time.time()
+    # Loop invariants resolved once: the earliest step limit and the pacing mode
+    step_limits = [args_cli.video_length] if args_cli.video and args_cli.video_length > 0 else []
+    if args_cli.max_steps > 0:
+        step_limits.append(args_cli.max_steps)
+    step_limit = min(step_limits) if step_limits else None
+    real_time = args_cli.real_time
+
+    # Absolute deadlines keep real-time playback from drifting by per-step overhead
+    next_deadline = time.monotonic()
 
+    while simulation_app.is_running():
         inf_start = time.perf_counter()
         actions = policy(obs)
         inf_time = (time.perf_counter() - inf_start) * 1000
@@ -371,31 +381,32 @@ def main(
         current_episode_reward += rewards
         done_envs = dones.nonzero(as_tuple=False).squeeze(-1)
         if len(done_envs) > 0:
-            for idx in done_envs:
-                episode_rewards.append(current_episode_reward[idx].item())
+            episode_rewards.extend(current_episode_reward[done_envs].tolist())
             current_episode_reward[done_envs] = 0.0
 
-        total_reward += rewards.sum().item()
+        total_reward += rewards.sum()
         timestep += 1
 
         if timestep % 100 == 0:
             avg_inf_time = np.mean(inference_times[-100:])
             print(
                 f"Step {timestep}: "
-                f"avg_reward={total_reward / (timestep * env_cfg.scene.num_envs):.4f}, "
+                f"avg_reward={total_reward.item() / (timestep * num_envs):.4f}, "
                 f"episodes={len(episode_rewards)}, "
                 f"inf_time={avg_inf_time:.2f}ms"
             )
 
-        if args_cli.video and timestep == args_cli.video_length:
-            break
-
-        if args_cli.max_steps > 0 and timestep >= args_cli.max_steps:
+        if step_limit is not None and timestep >= step_limit:
             break
 
-        sleep_time = dt - (time.time() - start_time)
-        if args_cli.real_time and sleep_time > 0:
-            time.sleep(sleep_time)
+        if real_time:
+            next_deadline += dt
+            sleep_time = next_deadline - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            else:
+                # Running behind; resync instead of bursting steps to catch up
+                next_deadline = time.monotonic()
 
     print("-" * 60)
     print(f"\n[RESULTS] {model_format.upper()} Policy Inference Summary")
@@ -414,7 +425,7 @@ def main(
         metrics = {
             "format": model_format,
             "task": args_cli.task,
-            "num_envs": env_cfg.scene.num_envs,
+            "num_envs": num_envs,
             "total_steps": timestep,
             "total_episodes": len(episode_rewards),
             "mean_episode_reward": float(np.mean(episode_rewards)) if episode_rewards else 0.0,
@@ -429,7 +440,7 @@ def main(
             "p95_inference_time_ms": float(np.percentile(inference_times, 95)),
             "p99_inference_time_ms": float(np.percentile(inference_times, 99)),
             "throughput_steps_per_sec": timestep / (sum(inference_times) / 1000) if inference_times else 0.0,
-            "total_reward": float(total_reward),
+            "total_reward": total_reward.item(),
         }
         if model_format == "onnx":
             metrics["use_gpu"] = args_cli.use_gpu
@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 EXIT_SUCCESS = 0
@@ -96,6 +97,25 @@ def verify_dataset(dataset_dir: Path) -> dict | None:
     return info
 
 
+def _read_parquet_tables(paths: list[Path], max_workers: int = 8) -> list:
+    """Read parquet files concurrently, preserving input order.
+
+    Args:
+        paths: Parquet files to read.
+        max_workers: Upper bound on concurrent file reads.
+
+    Returns:
+        List of pyarrow Tables in the same order as ``paths``.
+    """
+    import pyarrow.parquet as pq
+
+    if len(paths) <= 1:
+        return [pq.read_table(p) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(pq.read_table, paths))
+
+
 def patch_info_paths(dataset_dir: Path, info: dict) -> None:
     """Patch info.json path templates, split data, and reorganize videos for v0.3.x.
 
@@ -113,8 +133,8 @@ def patch_info_paths(dataset_dir: Path, info: dict) -> None:
     """
     import shutil
 
+    import numpy as np
     import pyarrow as pa
-    import pyarrow.compute
     import pyarrow.parquet as pq
 
     info_path = dataset_dir / "meta" / "info.json"
@@ -128,24 +148,24 @@ def patch_info_paths(dataset_dir: Path, info: dict) -> None:
 
     # --- Split monolithic parquet files into per-episode files ---
     data_dir = dataset_dir / "data"
-    tables = []
-    for fpath in sorted(data_dir.rglob("*.parquet")):
-        tables.append(pq.read_table(fpath))
+    tables = _read_parquet_tables(sorted(data_dir.rglob("*.parquet")))
 
     if not tables:
         return
 
-    combined = pa.concat_tables(tables)
-    episodes = sorted(set(combined["episode_index"].to_pylist()))
+    # Sort once so each episode is a contiguous zero-copy slice instead of a full-table filter per episode
+    combined = pa.concat_tables(tables).sort_by("episode_index")
+    episode_column = combined["episode_index"].to_numpy()
+    episodes, starts = np.unique(episode_column, return_index=True)
+    ends = np.append(starts[1:], len(episode_column))
     total_episodes = len(episodes)
 
-    for ep_idx in episodes:
+    for ep_idx, start, end in zip(episodes.tolist(), starts.tolist(), ends.tolist(), strict=True):
         ep_chunk = ep_idx // chunks_size
         chunk_dir = data_dir / f"chunk-{ep_chunk:03d}"
         chunk_dir.mkdir(parents=True, exist_ok=True)
         ep_path = chunk_dir / f"episode_{ep_idx:06d}.parquet"
-        mask = pa.compute.equal(combined["episode_index"], ep_idx)
-        pq.write_table(combined.filter(mask), ep_path)
+        pq.write_table(combined.slice(start, end - start), ep_path)
 
     for fpath in sorted(data_dir.rglob("file-*.parquet")):
         fpath.unlink()
@@ -249,6 +269,7 @@ def fix_video_timestamps(dataset_dir: Path, info: dict) -> None:
         dataset_dir: Path to dataset directory.
         info: Parsed info.json contents.
     """
+    import numpy as np
     import pyarrow as pa
     import pyarrow.parquet as pq
 
@@ -263,27 +284,28 @@ def fix_video_timestamps(dataset_dir: Path, info: dict) -> None:
     episodes_dir = dataset_dir / "meta" / "episodes"
     for fpath in episodes_dir.rglob("*.parquet"):
         table = pq.read_table(fpath)
-        columns = {c: table[c].to_pylist() for c in table.column_names}
         modified = False
 
         for vk in video_keys:
             from_col = f"videos/{vk}/from_timestamp"
             to_col = f"videos/{vk}/to_timestamp"
-            if from_col not in columns or to_col not in columns:
+            if from_col not in table.column_names or to_col not in table.column_names:
+                continue
+
+            from_ts = table[from_col].to_numpy()
+            to_ts = table[to_col].to_numpy()
+            new_to = table["length"].to_numpy() / fps
+            stale = (np.abs(from_ts) > 0.01) | (np.abs(to_ts - new_to) > 0.01)
+            if not stale.any():
                 continue
 
-            lengths = columns["length"]
-            for i in range(len(lengths)):
-                new_from = 0.0
-                new_to = lengths[i] / fps
-                if abs(columns[from_col][i] - new_from) > 0.01 or abs(columns[to_col][i] - new_to) > 0.01:
-                    columns[from_col][i] = new_from
-                    columns[to_col][i] = new_to
-                    modified = True
+            for col, values in ((from_col, np.where(stale, 0.0, from_ts)), (to_col, np.where(stale, new_to, to_ts))):
+                col_idx = table.column_names.index(col)
+                table = table.set_column(col_idx, table.schema.field(col), pa.array(values, type=table[col].type))
+            modified = True
 
         if modified:
-            new_table = pa.table({c: columns[c] for c in table.column_names})
-            pq.write_table(new_table, fpath)
+            pq.write_table(table, fpath)
             print(f"Fixed cumulative video timestamps in {fpath.name}")
         else:
             print("Video timestamps already per-episode, no fix needed")
@@ -292,15 +314,16 @@ def fix_video_timestamps(dataset_dir: Path, info: dict) -> None:
     data_dir = dataset_dir / "data"
     fixed_data = 0
     for fpath in data_dir.rglob("*.parquet"):
-        table = pq.read_table(fpath)
-        ts = table["timestamp"].to_pylist()
-        if not ts:
+        # Check drift on the timestamp column alone; only rewrite files that need it
+        ts = pq.read_table(fpath, columns=["timestamp"])["timestamp"].to_numpy()
+        if ts.size == 0:
             continue
 
-        aligned_ts = [i / fps for i in range(len(ts))]
-        max_drift = max(abs(a - b) for a, b in zip(ts, aligned_ts, strict=True))
+        aligned_ts = np.arange(ts.size) / fps
+        max_drift = float(np.max(np.abs(ts - aligned_ts)))
 
         if max_drift > 0.02:
+            table = pq.read_table(fpath)
             col_idx = table.column_names.index("timestamp")
             new_col = pa.array(aligned_ts, type=pa.float64())
             table = table.set_column(col_idx, "timestamp", new_col)
@@ -330,11 +353,11 @@ def _read_episode_lengths(dataset_dir: Path, total_episodes: int) -> dict[int, i
     lengths: dict[int, int] = {}
     episodes_dir = dataset_dir / "meta" / "episodes"
     for fpath in sorted(episodes_dir.rglob("*.parquet")):
-        table = pq.read_table(fpath)
-        if "length" in table.column_names:
-            for row_idx in range(table.num_rows):
-                ep_idx = len(lengths)
-                lengths[ep_idx] = table["length"][row_idx].as_py()
+        if "length" not in pq.read_schema(fpath).names:
+            continue
+        # Decode only the length column and convert it in one pass
+        for length in pq.read_table(fpath, columns=["length"])["length"].to_pylist():
+            lengths[len(lengths)] = length
 
     return lengths
 
@@ -387,8 +410,6 @@ def ensure_episodes_stats(dataset_dir: Path, info: dict) -> None:
 
     import numpy as np
     import pyarrow as pa
-    import pyarrow.compute
-    import pyarrow.parquet as pq
 
     total_episodes = info.get("total_episodes", 0)
     if total_episodes == 0:
@@ -412,27 +433,28 @@ def ensure_episodes_stats(dataset_dir: Path, info: dict) -> None:
 
     # Read all data from parquet files and group by episode
     data_dir = dataset_dir / "data"
-    tables = []
-    for fpath in sorted(data_dir.rglob("*.parquet")):
-        tables.append(pq.read_table(fpath))
+    tables = _read_parquet_tables(sorted(data_dir.rglob("*.parquet")))
 
     if not tables:
         print("No data parquet files found, skipping episodes_stats")
         return
 
-    combined = pa.concat_tables(tables)
+    # Sort once so each episode is a contiguous slice instead of a full-table filter per episode
+    combined = pa.concat_tables(tables).sort_by("episode_index")
+    bounds = np.searchsorted(combined["episode_index"].to_numpy(), np.arange(total_episodes + 1))
+
+    # Materialize each feature once as a float32 (N, dim) array; episodes are row slices of it
+    feature_arrays = {
+        feat: _column_to_float32(combined[feat]) for feat in numeric_features if feat in combined.column_names
+    }
 
     with open(stats_path, "w") as f:
         for ep in range(total_episodes):
-            mask = pa.compute.equal(combined["episode_index"], ep)
-            ep_table = combined.filter(mask)
+            start, stop = bounds[ep], bounds[ep + 1]
             ep_stats: dict = {}
 
-            for feat in numeric_features:
-                if feat not in ep_table.column_names:
-                    continue
-                col = ep_table[feat]
-                arr = np.array(col.to_pylist(), dtype=np.float32)
+            for feat, values in feature_arrays.items():
+                arr = values[start:stop]
                 if arr.size == 0:
                     continue
                 ep_stats[feat] = {
@@ -443,7 +465,7 @@ def ensure_episodes_stats(dataset_dir: Path, info: dict) -> None:
                     "count": [len(arr)],
                 }
 
-            ep_count = ep_table.num_rows
+            ep_count = int(stop - start)
             for key, feat_meta in features.items():
                 if feat_meta.get("dtype") in ("video", "image"):
                     ep_stats[key] = {**image_stats_template, "count": [ep_count]}
@@ -453,6 +475,32 @@ def ensure_episodes_stats(dataset_dir: Path, info: dict) -> None:
     print(f"Created {stats_path.name} with per-episode stats for {total_episodes} episodes")
 
 
+def _column_to_float32(column):
+    """Convert an Arrow column to a float32 numpy array without Python lists.
+
+    List-typed columns (e.g. observation.state) are flattened into their child
+    values and reshaped to (N, dim); an empty column yields shape (0, 0). Lists
+    of lists have no flat child buffer and fall back to ``to_pylist``.
+
+    Args:
+        column: pyarrow ChunkedArray of scalars or one-level lists.
+
+    Returns:
+        Array of shape (N,) or (N, dim).
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    array = column.combine_chunks()
+    if pa.types.is_list(array.type) or pa.types.is_large_list(array.type) or pa.types.is_fixed_size_list(array.type):
+        values = array.flatten()
+        if pa.types.is_nested(values.type):
+            return np.array(array.to_pylist(), dtype=np.float32)
+        flat = values.to_numpy(zero_copy_only=False).astype(np.float32)
+        return flat.reshape(len(array), len(flat) // max(len(array), 1))
+    return array.to_numpy(zero_copy_only=False).astype(np.float32)
+
+
 def _verify_file_paths(dataset_dir: Path, info: dict) -> None:
     """Print diagnostic info about expected vs actual file paths."""
     total_episodes = info.get("total_episodes", 0)